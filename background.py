@@ -1,24 +1,68 @@
 # background.py
 
 import pygame
-import random
-from config import WIDTH, HEIGHT
+import numpy as np
+from config import WIDTH, HEIGHT, BACKGROUND_MODE
+
+JITTER_FRAMES = 256   # frames of star jitter drawn per RNG call
 
 class Background:
-    def __init__(self):
-        # Example starfield background
-        self.stars = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(100)]
+    def __init__(self, mode=BACKGROUND_MODE, num_stars=100):
+        # The mode is fixed for the lifetime of the background, so bind the
+        # per-frame methods once here instead of branching every frame.
+        if mode == "solid":
+            self.update = self._update_static
+            self.draw = self._draw_solid
+            return
+        if mode == "stars_static":
+            self.update = self._update_static
+        elif mode != "stars":
+            raise ValueError(f"Unknown background mode: {mode!r}")
+
+        # Example starfield background, one (x, y) row per star
+        self.stars = np.column_stack((
+            np.random.randint(0, WIDTH, num_stars, dtype=np.int32),
+            np.random.randint(0, HEIGHT, num_stars, dtype=np.int32)
+        ))
+        self._dims = np.array([WIDTH, HEIGHT], dtype=np.int32)
+        self._refill_jitter()
+        # A radius-1 circle rasterises to a 2x2 block up/left of its centre,
+        # so one pre-filled sprite blitted at (x-1, y-1) draws the same star.
+        self._star = pygame.Surface((2, 2))
+        self._star.fill((255, 255, 255))
+
+        if mode == "stars_static":
+            # The layout never changes, so render it once and blit per frame
+            # in the display's format, so the per-frame blit is a plain copy
+            self._cache = pygame.Surface((WIDTH, HEIGHT)).convert()
+            self._cache.fill((0, 0, 0))
+            self.draw(self._cache)
+            self.draw = self._draw_cached
 
     def update(self, dt):
-        # Simple twinkle/movement: jitter each star
-        new_stars = []
-        for x, y in self.stars:
-            nx = (x + random.randint(-1, 1)) % WIDTH
-            ny = (y + random.randint(-1, 1)) % HEIGHT
-            new_stars.append((nx, ny))
-        self.stars = new_stars
+        # Simple twinkle/movement: jitter each star, wrapping at the edges
+        self.stars += self._jitter[self._jitter_i]
+        np.mod(self.stars, self._dims, out=self.stars)
+        self._jitter_i += 1
+        if self._jitter_i == JITTER_FRAMES:
+            self._refill_jitter()
+
+    def _refill_jitter(self):
+        self._jitter = np.random.randint(
+            -1, 2, size=(JITTER_FRAMES, *self.stars.shape), dtype=np.int8)
+        self._jitter_i = 0
 
     def draw(self, surf):
         surf.fill((0, 0, 0))  # Solid black
-        for x, y in self.stars:
-            pygame.draw.circle(surf, (255, 255, 255), (x, y), 1)
+        star = self._star
+        surf.blits([(star, (x - 1, y - 1)) for x, y in self.stars.tolist()],
+                   doreturn=False)
+
+    def _update_static(self, dt):
+        pass
+
+    def _draw_cached(self, surf):
+        surf.blit(self._cache, (0, 0))
+
+    def _draw_solid(self, surf):
+        surf.fill((0, 0, 0))
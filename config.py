@@ -1,41 +1,54 @@
 # config.py
 # All configurable constants and settings
+#
+# The constants below are annotated Final: they are read in per-frame
+# code and must never be reassigned at runtime. Values the player may
+# change live belong in `settings`.
+
+from dataclasses import dataclass
+from typing import Final
 
 # Window dimensions (increased 25%: 800×600 → 1000×750)
-WIDTH = 1920
-HEIGHT = 1080
+WIDTH: Final[int] = 1920
+HEIGHT: Final[int] = 1080
 
 # Frames per second
-FPS = 60
+FPS: Final[int] = 60
 
 # Movement & Physics Settings
-ACCELERATION = 600.0       # Force multiplier when moving via mouse
-FRICTION = 0.97           # Damping factor applied each frame
-MIN_THRUST = 10         # Distance threshold for max thrust
+ACCELERATION: Final[float] = 600.0       # Force multiplier when moving via mouse
+FRICTION: Final[float] = 0.97           # Damping factor applied each frame
+MIN_THRUST: Final[int] = 10         # Distance threshold for max thrust
 
 # Fuel and cooldown
-FUEL_CONSUMPTION_RATE = 30
-FUEL_RECHARGE_RATE = 3.0
-COOLDOWN_DURATION = 10.0
+FUEL_CONSUMPTION_RATE: Final[int] = 30
+FUEL_RECHARGE_RATE: Final[float] = 3.0
+COOLDOWN_DURATION: Final[float] = 10.0
 
 # Emitter Settings
-EMITTER_CONE_ANGLE = 30  # Total cone angle in degrees
-PARTICLE_RATE = 30       # Particles spawned per second
+EMITTER_CONE_ANGLE: Final[int] = 30  # Total cone angle in degrees
+PARTICLE_RATE: Final[int] = 30       # Particles spawned per second
+
+# Background style: "stars" (twinkling), "stars_static" or "solid"
+BACKGROUND_MODE: Final[str] = "stars"
 
 # World scaling
-WORLD_SCALE = 10
-WORLD_WIDTH = WIDTH * WORLD_SCALE
-WORLD_HEIGHT = HEIGHT * WORLD_SCALE
-
-# Settings dictionary for UI editing
-settings_data = {
-    "FPS": FPS,
-    "FUEL_CONSUMPTION_RATE": FUEL_CONSUMPTION_RATE,
-    "FUEL_RECHARGE_RATE": FUEL_RECHARGE_RATE,
-    "COOLDOWN_DURATION": COOLDOWN_DURATION,
-    "ACCELERATION": ACCELERATION,
-    "FRICTION": FRICTION,
-    "MIN_THRUST": MIN_THRUST,
-    "EMITTER_CONE_ANGLE": EMITTER_CONE_ANGLE,
-    "PARTICLE_RATE": PARTICLE_RATE
-}
+WORLD_SCALE: Final[int] = 10
+WORLD_WIDTH: Final[int] = WIDTH * WORLD_SCALE
+WORLD_HEIGHT: Final[int] = HEIGHT * WORLD_SCALE
+
+# Live settings for UI editing. Field names match the constants above so
+# the settings screen can address them by name with getattr/setattr.
+@dataclass(slots=True)
+class Settings:
+    FPS: int = FPS
+    FUEL_CONSUMPTION_RATE: float = FUEL_CONSUMPTION_RATE
+    FUEL_RECHARGE_RATE: float = FUEL_RECHARGE_RATE
+    COOLDOWN_DURATION: float = COOLDOWN_DURATION
+    ACCELERATION: float = ACCELERATION
+    FRICTION: float = FRICTION
+    MIN_THRUST: float = MIN_THRUST
+    EMITTER_CONE_ANGLE: float = EMITTER_CONE_ANGLE
+    PARTICLE_RATE: float = PARTICLE_RATE
+
+settings = Settings()
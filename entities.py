@@ -12,10 +12,11 @@ from entities_player import Player
 from entities_obstacles import (
     Obstacle,
     ChaserObstacle,
-    SplitterObstacle
+    SplitterObstacle,
+    ObstacleField
 )
 
-from entities_particle import Particle
+from entities_particle import ParticleSystem
 
 from entities_emitter import Emitter
 
@@ -28,5 +29,6 @@ from entities_pickups import (
     ShieldPickup,
     SlowMotionPickup,
     ScoreMultiplierPickup,
-    MagnetPickup
+    MagnetPickup,
+    pulse_pickups
 )
@@ -1,30 +1,27 @@
 # entities_emitter.py
 
+import math
 from config import PARTICLE_RATE, EMITTER_CONE_ANGLE
-from entities_particle import Particle
+from entities_particle import ParticleSystem
 
-class Emitter:
-    def __init__(self, pos):
+class Emitter(ParticleSystem):
+    """
+    Particle system that streams new particles from ``pos`` at ``rate``
+    per second while emitting.
+    """
+    def __init__(self, pos, max_particles=100):
+        super().__init__(max_particles)
         self.pos = pos.copy()
-        self.particles = []
         self.rate = PARTICLE_RATE
         self.accumulator = 0
-        self.max_particles = 100
 
     def update(self, dt, emitting, cone_direction=None):
         if emitting:
             self.accumulator += dt*self.rate
-            while self.accumulator>1:
-                if len(self.particles)<self.max_particles:
-                    self.particles.append(
-                        Particle(self.pos, direction=cone_direction,
-                                 cone_angle=EMITTER_CONE_ANGLE)
-                    )
-                self.accumulator-=1
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.life>0]
-
-    def draw(self, surf):
-        for p in self.particles:
-            p.draw(surf)
+            # Whole particles owed; ceil(a) - 1 keeps the old "while a > 1"
+            # behaviour of always leaving a remainder in (0, 1].
+            due = math.ceil(self.accumulator) - 1
+            if due > 0:
+                self.spawn(self.pos, due, cone_direction, EMITTER_CONE_ANGLE)
+                self.accumulator -= due
+        super().update(dt)
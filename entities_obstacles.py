@@ -7,8 +7,30 @@ import numpy as np
 from config import WIDTH, HEIGHT
 from entities_utils import irregular_polygon, star_polygon
 
+# Column layout of an obstacle's state row (see ObstacleField)
+COL_X, COL_Y, COL_DIR, COL_VX, COL_VY, COL_SPEED, COL_RADIUS = range(7)
+COL_ROT, COL_CHASER = 7, 8      # chaser spin angle; 1.0 marks a chaser
+NUM_COLS = 9
+
+
+def _spawn_away_from(player_pos, safe_zone, reach=WIDTH):
+    """Random point between safe_zone and reach away from the player.
+
+    Sampled directly in polar form; drawing r from sqrt(uniform(r0^2, r1^2))
+    keeps the points evenly spread over the ring's area.
+    """
+    theta = random.uniform(0, 2 * math.pi)
+    r = math.sqrt(random.uniform(safe_zone * safe_zone, reach * reach))
+    return (player_pos[0] + r * math.cos(theta),
+            player_pos[1] + r * math.sin(theta))
+
 class Obstacle:
+    sides, variation = 8, 0.4           # outline of the irregular polygon
+
     def __init__(self, level, player_pos=None):
+        # All per-frame state lives in one float32 row so an ObstacleField can
+        # adopt it; a standalone obstacle simply owns its row.
+        self._bind(np.zeros(NUM_COLS, dtype=np.float32))
         self.radius = random.randint(10, 30)
         self.color = (
             random.randint(50, 200),
@@ -19,45 +41,83 @@ class Obstacle:
         self.speed = random.uniform(50, 120) + level * 5
         self.score_value = 10
         self.explode = True
+        # The irregular outline is rolled once; draw only scales and offsets it
+        self._shape = irregular_polygon((0, 0), 1.0, self.sides, self.variation)
 
         if player_pos is not None:
-            safe_zone = WIDTH / 8
-            while True:
-                x = random.randint(int(player_pos[0] - WIDTH), int(player_pos[0] + WIDTH))
-                y = random.randint(int(player_pos[1] - HEIGHT), int(player_pos[1] + HEIGHT))
-                pos = np.array([x, y], dtype=float)
-                if np.linalg.norm(pos - player_pos) >= safe_zone:
-                    break
-            self.pos = pos
+            self.pos = _spawn_away_from(player_pos, WIDTH / 8)
         else:
             self.pos = np.array([
                 random.randint(0, WIDTH),
                 random.randint(0, HEIGHT)
             ], dtype=float)
 
-    def update(self, dt, player_pos=None):
-        dx = math.cos(self.direction) * self.speed * dt
-        dy = math.sin(self.direction) * self.speed * dt
-        self.pos[0] += dx
-        self.pos[1] += dy
+    def _bind(self, row):
+        self._row = row
+        self._pos = row[COL_X:COL_Y + 1]
+
+    @property
+    def pos(self):
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos[:] = value
+
+    @property
+    def direction(self):
+        return float(self._row[COL_DIR])
+
+    @direction.setter
+    def direction(self, value):
+        self._row[COL_DIR] = value
+        self._set_velocity()
+
+    @property
+    def speed(self):
+        return float(self._row[COL_SPEED])
 
-        min_x, max_x = self.radius, WIDTH - self.radius
-        min_y, max_y = self.radius, HEIGHT - self.radius
+    @speed.setter
+    def speed(self, value):
+        self._row[COL_SPEED] = value
+        self._set_velocity()
 
-        if self.pos[0] < min_x or self.pos[0] > max_x:
-            self.pos[0] = max(min_x, min(self.pos[0], max_x))
-            self.direction = math.pi - self.direction
-        if self.pos[1] < min_y or self.pos[1] > max_y:
-            self.pos[1] = max(min_y, min(self.pos[1], max_y))
-            self.direction = -self.direction
+    def _set_velocity(self, _cos=math.cos, _sin=math.sin):
+        # Cache the velocity vector; it only changes with direction or speed
+        row = self._row
+        d, v = row[COL_DIR], row[COL_SPEED]
+        row[COL_VX] = _cos(d) * v
+        row[COL_VY] = _sin(d) * v
+
+    @property
+    def radius(self):
+        return float(self._row[COL_RADIUS])
+
+    @radius.setter
+    def radius(self, value):
+        self._row[COL_RADIUS] = value
+
+    def update(self, dt, player_pos=None, _W=WIDTH, _H=HEIGHT, _pi=math.pi):
+        # _W, _H, _pi: constants bound as locals
+        row = self._row
+        x, y, d, vx, vy, _, r = row[:COL_RADIUS + 1].tolist()
+        x += vx * dt
+        y += vy * dt
+
+        # Clamp, and reflect by negating one velocity component exactly as
+        # ObstacleField.step does, so a bounce needs no cos/sin.
+        cx = min(max(x, r), _W - r)
+        if cx != x:
+            x, d, vx = cx, _pi - d, -vx
+        cy = min(max(y, r), _H - r)
+        if cy != y:
+            y, d, vy = cy, -d, -vy
+        row[:COL_SPEED] = (x, y, d, vx, vy)
 
     def draw(self, surf):
-        pts = irregular_polygon(
-            (self.pos[0], self.pos[1]),
-            self.radius,
-            num_sides=8,
-            variation=0.4
-        )
+        cx, cy = self.pos.tolist()
+        r = self.radius
+        pts = [(cx + x * r, cy + y * r) for x, y in self._shape]
         pygame.draw.polygon(surf, self.color, pts)
 
 class ChaserObstacle(Obstacle):
@@ -66,20 +126,33 @@ class ChaserObstacle(Obstacle):
         self.speed *= 0.7
         self.score_value = 20
         self.rotation = 0
+        self._row[COL_CHASER] = 1.0
+
+    @property
+    def rotation(self):
+        return float(self._row[COL_ROT])
+
+    @rotation.setter
+    def rotation(self, value):
+        self._row[COL_ROT] = value
 
     def update(self, dt, player_pos):
+        self.steer(dt, player_pos)
+        super().update(dt, player_pos)
+
+    def steer(self, dt, player_pos, _atan2=math.atan2):
+        """Turn halfway toward the player; movement is applied separately."""
         if player_pos is not None:
-            target_angle = math.atan2(
+            target_angle = _atan2(
                 player_pos[1] - self.pos[1],
                 player_pos[0] - self.pos[0]
             )
             self.direction = (self.direction + target_angle) / 2.0
         self.rotation += 0.1 * dt
-        super().update(dt, player_pos)
 
     def draw(self, surf):
         pts = star_polygon(
-            (self.pos[0], self.pos[1]),
+            self.pos.tolist(),
             outer_radius=self.radius,
             inner_radius=self.radius / 2,
             spikes=5,
@@ -88,6 +161,8 @@ class ChaserObstacle(Obstacle):
         pygame.draw.polygon(surf, self.color, pts)
 
 class SplitterObstacle(Obstacle):
+    sides, variation = 7, 0.3
+
     def __init__(self, level, player_pos=None):
         super().__init__(level, player_pos)
         self.radius = random.randint(20, 30)
@@ -109,11 +184,122 @@ class SplitterObstacle(Obstacle):
         child2.pos = self.pos.copy()
         return [child1, child2]
 
-    def draw(self, surf):
-        pts = irregular_polygon(
-            (self.pos[0], self.pos[1]),
-            self.radius,
-            num_sides=7,
-            variation=0.3
-        )
-        pygame.draw.polygon(surf, self.color, pts)
+class ObstacleField:
+    """
+    List-like container that stores every obstacle's state row in one
+    array, so movement and bouncing run as a few NumPy passes per frame
+    instead of one Python update() call per obstacle.
+    """
+    def __init__(self, capacity=64):
+        self.rows = np.zeros((capacity, NUM_COLS), dtype=np.float32)
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def append(self, obstacle):
+        n = len(self.items)
+        if n == len(self.rows):
+            self._grow()
+        self.rows[n] = obstacle._row
+        obstacle._bind(self.rows[n])
+        obstacle._slot = n
+        self.items.append(obstacle)
+
+    def extend(self, obstacles):
+        for o in obstacles:
+            self.append(o)
+
+    def remove(self, obstacle):
+        i = getattr(obstacle, "_slot", -1)
+        if not 0 <= i < len(self.items) or self.items[i] is not obstacle:
+            raise ValueError("obstacle is not in this field")
+        # Detach with a private copy of its state, then swap the last row in
+        obstacle._bind(obstacle._row.copy())
+        last = self.items.pop()
+        if last is not obstacle:
+            self.rows[i] = self.rows[len(self.items)]
+            last._bind(self.rows[i])
+            last._slot = i
+            self.items[i] = last
+
+    def clear(self):
+        for o in self.items:
+            o._bind(o._row.copy())
+        self.items.clear()
+
+    def _grow(self):
+        rows = np.zeros((len(self.rows) * 2, NUM_COLS), dtype=np.float32)
+        rows[:len(self.rows)] = self.rows
+        self.rows = rows
+        for i, o in enumerate(self.items):
+            o._bind(rows[i])
+
+    def step(self, dt, player_pos=None, _W=WIDTH, _H=HEIGHT):
+        """Advance every obstacle by dt; same motion as Obstacle.update."""
+        n = len(self.items)
+        if not n:
+            return
+        rows = self.rows[:n]
+        self._steer_chasers(rows, dt, player_pos)
+
+        x, y = rows[:, COL_X], rows[:, COL_Y]
+        d, r = rows[:, COL_DIR], rows[:, COL_RADIUS]
+        vx, vy = rows[:, COL_VX], rows[:, COL_VY]
+        x += vx * dt
+        y += vy * dt
+
+        # Reflecting the heading negates one velocity component:
+        # cos(pi - d) == -cos(d) and sin(-d) == -sin(d).
+        hit = (x < r) | (x > _W - r)
+        if hit.any():
+            np.clip(x, r, _W - r, out=x)
+            d[hit] = math.pi - d[hit]
+            vx[hit] = -vx[hit]
+        hit = (y < r) | (y > _H - r)
+        if hit.any():
+            np.clip(y, r, _H - r, out=y)
+            d[hit] = -d[hit]
+            vy[hit] = -vy[hit]
+
+    def _steer_chasers(self, rows, dt, player_pos):
+        """ChaserObstacle.steer for every chaser row at once."""
+        chasers = np.flatnonzero(rows[:, COL_CHASER])
+        if not len(chasers):
+            return
+        rows[chasers, COL_ROT] += 0.1 * dt
+        if player_pos is None:
+            return
+        c = rows[chasers]
+        d = (c[:, COL_DIR] + np.arctan2(player_pos[1] - c[:, COL_Y],
+                                        player_pos[0] - c[:, COL_X])) / 2.0
+        rows[chasers, COL_DIR] = d
+        rows[chasers, COL_VX] = np.cos(d) * c[:, COL_SPEED]
+        rows[chasers, COL_VY] = np.sin(d) * c[:, COL_SPEED]
+
+    def touching(self, points, radii=0):
+        """
+        (obstacles, points) mask: True where point j, a circle of radii[j],
+        overlaps obstacle i. One broadcast over every pair.
+        """
+        rows = self.rows[:len(self.items)]
+        d = points[None, :, :] - rows[:, None, COL_X:COL_Y + 1]
+        reach = rows[:, COL_RADIUS, None] + radii
+        return (d * d).sum(axis=2) < reach * reach
+
+    def colliding(self, pos, radius):
+        """Obstacles whose circle overlaps the circle (pos, radius)."""
+        # Positions change every step, so a spatial hash would be rebuilt
+        # for each query; one pass over the columns is cheaper at any size
+        rows = self.rows[:len(self.items)]
+        dx = rows[:, COL_X] - pos[0]
+        dy = rows[:, COL_Y] - pos[1]
+        reach = rows[:, COL_RADIUS] + radius
+        hits = np.flatnonzero(dx * dx + dy * dy < reach * reach)
+        return [self.items[i] for i in hits.tolist()]
@@ -1,40 +1,110 @@
 # entities_particle.py
 
-import random
 import math
-import time
 import numpy as np
 import pygame
 
-class Particle:
-    def __init__(self, pos, direction=None, cone_angle=None):
-        self.pos = np.array(pos, dtype=float)
+_rng = np.random.default_rng()   # batch draws for ParticleSystem.spawn
+
+# ParticleSystem colour channels take 4 levels (102, 153, 204, 255), so
+# with radii 2..5 there are at most 256 distinct particle looks. Each is
+# rendered once into a colour-keyed sprite, keyed by radius<<24 | rgb.
+_SPRITES = {}
+
+def _particle_sprite(key):
+    r = key >> 24
+    color = ((key >> 16) & 255, (key >> 8) & 255, key & 255)
+    sprite = pygame.Surface((2 * r, 2 * r))
+    sprite.set_colorkey((0, 0, 0))
+    pygame.draw.circle(sprite, color, (r, r), r)
+    _SPRITES[key] = sprite
+    return sprite
+
+_RGB_WEIGHTS = np.array([1 << 16, 1 << 8, 1], dtype=np.int64)
+
+class ParticleSystem:
+    """
+    A batch of particles stored as parallel arrays (one row per particle).
+    Only the first ``n`` rows are live; dead rows are compacted away.
+    Spawned particles head in a uniform direction (full circle, or the
+    given cone) at 50-150 px/s, live 1-2 s, have a radius of 2-5 px and
+    take each colour channel from 102, 153, 204 or 255.
+    """
+    def __init__(self, max_particles=100):
+        self.max_particles = max_particles
+        self.n = 0
+        self.positions  = np.empty((max_particles, 2), dtype=np.float32)
+        self.velocities = np.empty((max_particles, 2), dtype=np.float32)
+        self.lives      = np.empty(max_particles, dtype=np.float32)
+        self.radii      = np.empty(max_particles, dtype=np.int32)
+        self.colors     = np.empty((max_particles, 3), dtype=np.uint8)
+        self._step      = np.empty((max_particles, 2), dtype=np.float32)
+
+    def _columns(self):
+        return (self.positions, self.velocities, self.lives,
+                self.radii, self.colors)
+
+    def spawn(self, pos, count, direction=None, cone_angle=None):
+        """Append up to count new particles at pos in one batch of writes."""
+        i = self.n
+        j = min(i + count, self.max_particles)
+        k = j - i
+        if k <= 0:
+            return
+        # One draw of uniforms in [0, 1) per batch; every attribute is an
+        # affine map of its own column. Integer columns truncate on store,
+        # giving radii in 2..5 and colour channels on 4 levels in 102..255.
+        u = _rng.random((7, k))
         if direction is not None and cone_angle is not None:
-            half = math.radians(cone_angle) / 2
-            angle = random.uniform(direction - half, direction + half)
+            span = math.radians(cone_angle)
+            angles = u[0] * span + (direction - span / 2)
         else:
-            angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, 150)
-        self.vel = np.array([math.cos(angle) * speed,
-                             math.sin(angle) * speed], dtype=float)
-        self.radius = random.randint(2, 5)
-        self.life = random.uniform(1, 2)
-        self.birth = time.time()
-        self.color = (
-            random.randint(100, 255),
-            random.randint(100, 255),
-            random.randint(100, 255)
-        )
+            angles = u[0] * (2 * math.pi)
+        speeds = u[1] * 100 + 50
+        self.positions[i:j] = pos
+        self.velocities[i:j, 0] = np.cos(angles) * speeds
+        self.velocities[i:j, 1] = np.sin(angles) * speeds
+        self.lives[i:j] = u[2] + 1
+        self.radii[i:j] = u[3] * 4 + 2
+        self.colors[i:j] = (np.floor(u[4:] * 4) * 51 + 102).T
+        self.n = j
 
     def update(self, dt):
-        self.pos += self.vel * dt
-        self.life -= dt
+        n = self.n
+        if not n:
+            return
+        # Advance in place through a preallocated scratch buffer, so the
+        # per-frame update allocates nothing while every particle lives
+        step = np.multiply(self.velocities[:n], dt, out=self._step[:n])
+        self.positions[:n] += step
+        self.lives[:n] -= dt
+        alive = self.lives[:n] > 0
+        if not alive.all():
+            # Fill the holes below the new count with the survivors above
+            # it; only those few rows move, not the whole live range
+            k = int(alive.sum())
+            holes = np.flatnonzero(~alive[:k])
+            if len(holes):
+                src = np.flatnonzero(alive[k:]) + k
+                for arr in self._columns():
+                    arr[holes] = arr[src]
+            self.n = k
+
+    def kill(self, i):
+        """Remove particle i by moving the last live particle into its slot."""
+        last = self.n - 1
+        for arr in self._columns():
+            arr[i] = arr[last]
+        self.n = last
 
     def draw(self, surf):
-        if self.life > 0:
-            pygame.draw.circle(
-                surf,
-                self.color,
-                (int(self.pos[0]), int(self.pos[1])),
-                self.radius
-            )
+        n = self.n
+        if not n:
+            return
+        radii = self.radii[:n]
+        keys = (radii.astype(np.int64) << 24) + self.colors[:n] @ _RGB_WEIGHTS
+        dests = self.positions[:n].astype(np.int32) - radii[:, None]
+        sprites = _SPRITES
+        surf.blits([(sprites.get(k) or _particle_sprite(k), d)
+                    for k, d in zip(keys.tolist(), dests.tolist())],
+                   doreturn=False)
@@ -13,105 +13,122 @@ def _pos():
     )
 
 # ------------------------------------------------------------
-# Base‑class helper for the new glow effect
+# Shared drawing: glow + shape pre-rendered once per glow size
 # ------------------------------------------------------------
-def _glow(surface, centre, radius, color, ticks):
-    """Draw a faint pulsating ring behind the pickup."""
-    pulse = 2 + abs(math.sin(ticks * 0.005)) * 4       # 2‑6 px extra
-    glow_r = int(radius + pulse)
-    glow_color = (*color, 60)                          # low alpha
-    temp = pygame.Surface((glow_r*2, glow_r*2), pygame.SRCALPHA)
-    pygame.draw.circle(temp, glow_color, (glow_r, glow_r), glow_r)
-    surface.blit(temp, (centre[0]-glow_r, centre[1]-glow_r))
+_SPRITES = {}   # (pickup class, glow radius) -> SRCALPHA surface
+
+class _Sprite:
+    """Mixin drawing a pickup as one blit of its cached glow + shape.
+
+    The glow ring pulses 2-6 px beyond the shape, so each pickup type
+    only ever needs a handful of sprites, rendered the first time each
+    size is seen.
+    """
+    _pulse = 0.0                        # shared pulse, see pulse_pickups
+
+    def _shape_radius(self):
+        return self.radius
+
+    def _sprite(self):
+        glow_r = int(self._shape_radius() + 2 + self._pulse)
+        key = (type(self), glow_r)
+        sprite = _SPRITES.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((glow_r*2, glow_r*2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*self.color, 60), (glow_r, glow_r), glow_r)
+            self._shape(sprite, (glow_r, glow_r))
+            _SPRITES[key] = sprite
+        return sprite, glow_r
+
+    def blit_args(self):
+        """(sprite, dest) pair for this pickup, for Surface.blits."""
+        sprite, glow_r = self._sprite()
+        return sprite, (self.pos[0]-glow_r, self.pos[1]-glow_r)
+
+    def draw(self, surf):
+        surf.blit(*self.blit_args())
+
+def pulse_pickups(ticks):
+    """Set the glow pulse shared by every pickup type; call once per frame."""
+    _Sprite._pulse = abs(4*math.sin(ticks*0.005))
 
 # ------------------------------------------------------------
 # Cosmetic (no timer)
 # ------------------------------------------------------------
-class PowerUp:
+class PowerUp(_Sprite):
     def __init__(self):
         self.pos, self.base_radius, self.color = _pos(), 12, (50,200,50)
     @property
     def radius(self):
-        return self.base_radius + abs(4*math.sin(pygame.time.get_ticks()*0.005))
-    def draw(self, surf):
-        pts = regular_polygon(self.pos, self.base_radius, 6)
-        _glow(surf, self.pos, self.base_radius, self.color, pygame.time.get_ticks())
-        pygame.draw.polygon(surf, self.color, pts)
+        return self.base_radius + self._pulse
+    def _shape_radius(self):
+        return self.base_radius
+    def _shape(self, surf, c):
+        pygame.draw.polygon(surf, self.color, regular_polygon(c, self.base_radius, 6))
 
 # ------------------------------------------------------------
-# Timed pickups (all now 30 s instead of 10 s)
+# Timed pickups (all now 30 s instead of 10 s)
 # ------------------------------------------------------------
-class ImmunityPickup:                     # ← renamed
+class ImmunityPickup(_Sprite):            # ← renamed
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (0,255,0)
         self.effect, self.duration = "immunity", 30
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = regular_polygon(self.pos, self.radius, 4, rotation=math.pi/4)
+    def _shape(self, surf, c):
+        pts = regular_polygon(c, self.radius, 4, rotation=math.pi/4)
         pygame.draw.polygon(surf, self.color, pts)
 
-class BoostPickup:
+class BoostPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (255,105,180)
         self.effect, self.duration, self.score_bonus_factor = "tail_boost", 30, 0.1
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = regular_polygon(self.pos, self.radius, 3)
-        pygame.draw.polygon(surf, self.color, pts)
+    def _shape(self, surf, c):
+        pygame.draw.polygon(surf, self.color, regular_polygon(c, self.radius, 3))
 
-class ShieldPickup:
+class ShieldPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (0,191,255)
         self.effect, self.duration = "shield", 30
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        rect = (self.pos[0]-self.radius, self.pos[1]-self.radius,
+    def _shape(self, surf, c):
+        rect = (c[0]-self.radius, c[1]-self.radius,
                 2*self.radius, 2*self.radius)
         pygame.draw.rect(surf, self.color, rect)
 
-class SlowMotionPickup:
+class SlowMotionPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (138,43,226)
         self.effect, self.duration = "slow_motion", 30
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        rect = (self.pos[0]-self.radius, self.pos[1]-self.radius/2,
+    def _shape(self, surf, c):
+        rect = (c[0]-self.radius, c[1]-self.radius/2,
                 2*self.radius, self.radius)
         pygame.draw.ellipse(surf, self.color, rect)
 
-class ScoreMultiplierPickup:
+class ScoreMultiplierPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (255,165,0)
         self.effect, self.duration, self.multiplier = "score_multiplier", 30, 2
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = regular_polygon(self.pos, self.radius, 5)
-        pygame.draw.polygon(surf, self.color, pts)
+    def _shape(self, surf, c):
+        pygame.draw.polygon(surf, self.color, regular_polygon(c, self.radius, 5))
 
-class MagnetPickup:
+class MagnetPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (255,20,147)
         self.effect, self.duration = "magnet", 30
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = regular_polygon(self.pos, self.radius, 6)
-        pygame.draw.polygon(surf, self.color, pts)
+    def _shape(self, surf, c):
+        pygame.draw.polygon(surf, self.color, regular_polygon(c, self.radius, 6))
 
 # ------------------------------------------------------------
 # Instant‑score and special pickups (unchanged)
 # ------------------------------------------------------------
-class ScoreBoostPickup:
+class ScoreBoostPickup(_Sprite):
     def __init__(self):
         self.pos, self.radius, self.color = _pos(), 12, (255,215,0)
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = regular_polygon(self.pos, self.radius, 4, rotation=math.pi/4)
+    def _shape(self, surf, c):
+        pts = regular_polygon(c, self.radius, 4, rotation=math.pi/4)
         pygame.draw.polygon(surf, self.color, pts)
 
-class SpecialPickup:
+class SpecialPickup(_Sprite):
     def __init__(self, pos):
         self.pos, self.radius, self.color = np.array(pos,float), 15, (128,0,128)
-    def draw(self, surf):
-        _glow(surf, self.pos, self.radius, self.color, pygame.time.get_ticks())
-        pts = star_polygon(self.pos, self.radius, self.radius*0.75, 8)
+    def _shape(self, surf, c):
+        pts = star_polygon(c, self.radius, self.radius*0.75, 8)
         pygame.draw.polygon(surf, self.color, pts)
@@ -8,10 +8,10 @@
 import pygame
 import numpy as np
 import math
+from functools import lru_cache
 from config import (
     ACCELERATION, FRICTION, MIN_THRUST,
-    FUEL_CONSUMPTION_RATE, FUEL_RECHARGE_RATE, COOLDOWN_DURATION,
-    WIDTH, HEIGHT
+    WIDTH, HEIGHT, settings
 )
 from entities_utils import regular_polygon
 
@@ -39,15 +39,83 @@ EFFECT_COLORS = {
     "base":             (255, 200,  50),
 }
 
-def draw_glow(surface, pos, radius, color, alpha=60):
-    """Soft radial glow using an SRCALPHA temp surface."""
+# Whether each effect in PRIORITY is on for a given player
+EFFECT_ACTIVE = {
+    "immune":           lambda p: p.immune,
+    "shield_active":    lambda p: p.shield_active,
+    "special_ready":    lambda p: p.special_pickup,
+    "tail_boost":       lambda p: p.tail_multiplier > 1,
+    "magnet_active":    lambda p: p.magnet_active,
+    "score_multiplier": lambda p: p.score_multiplier > 1,
+    "slow_motion":      lambda p: p.slow_motion_active,
+}
+
+# Body shape per dominant effect (0 sides = circle)
+EFFECT_SIDES = {
+    "immune":           0,
+    "shield_active":    3,
+    "special_ready":    8,
+    "tail_boost":       5,
+    "magnet_active":    6,
+    "slow_motion":      4,
+    "score_multiplier": 10,
+}
+
+@lru_cache(maxsize=64)
+def _glow_surface(radius, color, alpha):
+    """SRCALPHA glow disc, rendered once per (radius, color, alpha)."""
     temp = pygame.Surface((radius*4, radius*4), pygame.SRCALPHA)
     pygame.draw.circle(temp, (*color, alpha), (radius*2, radius*2), radius*2)
-    surface.blit(temp, (pos[0]-radius*2, pos[1]-radius*2))
+    return temp
+
+def draw_glow(surface, pos, radius, color, alpha=60):
+    """Soft radial glow using a cached SRCALPHA surface."""
+    surface.blit(_glow_surface(radius, color, alpha),
+                 (pos[0]-radius*2, pos[1]-radius*2))
+
+@lru_cache(maxsize=64)
+def _body_sprite(radius, num_sides, color, rim_color):
+    """Player glow, body shape (0 sides = circle) and optional rim.
+
+    Drawn directly with RGBA colours, so the glow keeps alpha 70 and
+    the body and rim stay opaque, exactly as when drawn one by one.
+    """
+    glow_r = (radius + 4) * 2
+    c = (glow_r, glow_r)
+    sprite = pygame.Surface((glow_r*2, glow_r*2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*color, 70), c, glow_r)
+    if num_sides == 0:
+        pygame.draw.circle(sprite, color, c, radius)
+    else:
+        pygame.draw.polygon(sprite, color, regular_polygon(c, radius, num_sides))
+    if rim_color is not None:
+        pygame.draw.circle(sprite, rim_color, c, radius+2, 2)
+    return sprite
+
+@lru_cache(maxsize=256)
+def _ring_sprite(radius, level, thick, color):
+    """Arc of level/FUEL_RING_STEPS of a turn, clockwise from 12 o'clock."""
+    start = -math.pi / 2
+    sprite = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+    pygame.draw.arc(sprite, color, (0, 0, radius*2, radius*2),
+                    start, start + 2*math.pi * level / FUEL_RING_STEPS, thick)
+    return sprite
+
+@lru_cache(maxsize=8)
+def _magnet_offsets(reach):
+    """(cos, sin) * reach for each of the MAGNET_STEPS horn angles."""
+    return [(math.cos(2*math.pi*i/MAGNET_STEPS) * reach,
+             math.sin(2*math.pi*i/MAGNET_STEPS) * reach)
+            for i in range(MAGNET_STEPS)]
 
 def lerp(a, b, t):
     return a + (b - a) * t
 
+TRAIL_LENGTH = 50       # trail points per unit of tail_multiplier
+MAX_TRAIL    = 100      # ring capacity: TRAIL_LENGTH × the largest multiplier
+FUEL_RING_STEPS = 32    # distinct fuel / cooldown arc lengths
+MAGNET_STEPS = 128      # distinct magnet horn angles
+
 # ──────────────────────────────────────────────────────────
 # Player entity
 # ──────────────────────────────────────────────────────────
@@ -64,7 +132,9 @@ class Player:
         self.cooldown_timer    = 0
 
         # Gameplay modifiers
-        self.trail = []
+        self._trail      = np.zeros((MAX_TRAIL, 2), dtype=np.int32)  # ring buffer, pixels
+        self._trail_head = 0    # next slot to write
+        self._trail_len  = 0
         self.boosts = []
 
         # Power‑up flags / timers
@@ -84,78 +154,86 @@ class Player:
     # ──────────────────────────────────────────────────────
     # Movement / physics
     # ──────────────────────────────────────────────────────
-    def update(self, dt, target):
+    def update(self, dt, target,
+               _W=WIDTH, _H=HEIGHT, _accel=ACCELERATION, _friction=FRICTION,
+               _min_thrust=MIN_THRUST, _hypot=math.hypot):
         """Move toward world‑space target position."""
-        direction = target - self.pos
-        dist = np.linalg.norm(direction)
-        acc  = (direction / dist * ACCELERATION * min(dist / MIN_THRUST, 1)) if dist > 0 else np.zeros_like(self.pos)
-
-        self.vel += acc * dt
-        self.vel *= FRICTION
-        self.pos += self.vel * dt
-
-        min_x, max_x = self.radius, WIDTH - self.radius
-        min_y, max_y = self.radius, HEIGHT - self.radius
+        # underscore defaults bind constants as locals; work in floats
+        pos, vel = self.pos, self.vel
+        px, py = pos.tolist()
+        vx, vy = vel.tolist()
+        dx = float(target[0]) - px
+        dy = float(target[1]) - py
+        dist = _hypot(dx, dy)
+        if dist > 0:
+            thrust = _accel * min(dist / _min_thrust, 1) / dist * dt
+            vx += dx * thrust
+            vy += dy * thrust
 
-        clamped_x = max(min_x, min(self.pos[0], max_x))
-        clamped_y = max(min_y, min(self.pos[1], max_y))
+        vx *= _friction
+        vy *= _friction
+        px += vx * dt
+        py += vy * dt
 
-        if clamped_x != self.pos[0]:
-            self.pos[0] = clamped_x
-            self.vel[0] = 0
-        if clamped_y != self.pos[1]:
-            self.pos[1] = clamped_y
-            self.vel[1] = 0
+        # clamp to the screen; a component that moved loses its velocity
+        r = self.radius
+        cx = max(r, min(px, _W - r))
+        cy = max(r, min(py, _H - r))
+        if cx != px: vx = 0.0
+        if cy != py: vy = 0.0
+        pos[0], pos[1] = cx, cy
+        vel[0], vel[1] = vx, vy
 
         # trail build
-        self.trail.append(tuple(self.pos))
-        max_tail = 50 * self.tail_multiplier
-        if len(self.trail) > max_tail:
-            self.trail.pop(0)
+        self._trail[self._trail_head] = self.pos
+        self._trail_head = (self._trail_head + 1) % MAX_TRAIL
+        max_tail = min(TRAIL_LENGTH * self.tail_multiplier, MAX_TRAIL)
+        self._trail_len = min(self._trail_len + 1, max_tail)
+
+    @property
+    def trail(self):
+        """Trail points as an (n, 2) int32 pixel array, oldest first."""
+        n, head = self._trail_len, self._trail_head
+        start = (head - n) % MAX_TRAIL
+        if start + n <= MAX_TRAIL:
+            return self._trail[start:start + n]
+        return np.concatenate((self._trail[start:], self._trail[:head]))
 
     # ──────────────────────────────────────────────────────
     # Drawing helpers (power‑up visuals, gauges, etc.)
     # ──────────────────────────────────────────────────────
     def _active_effects(self):
         """Return list of (flag, color) for effects that are on."""
-        effects = []
-        if self.immune:             effects.append(("immune", EFFECT_COLORS["immune"]))
-        if self.shield_active:      effects.append(("shield_active", EFFECT_COLORS["shield_active"]))
-        if self.special_pickup:     effects.append(("special_ready", EFFECT_COLORS["special_ready"]))
-        if self.tail_multiplier > 1:effects.append(("tail_boost", EFFECT_COLORS["tail_boost"]))
-        if self.magnet_active:      effects.append(("magnet_active", EFFECT_COLORS["magnet_active"]))
-        if self.slow_motion_active: effects.append(("slow_motion", EFFECT_COLORS["slow_motion"]))
-        if self.score_multiplier>1: effects.append(("score_multiplier", EFFECT_COLORS["score_multiplier"]))
-        # sort by priority
-        effects.sort(key=lambda e: PRIORITY.index(e[0]))
-        return effects
+        # checked in PRIORITY order, so the list needs no sorting
+        return [(flag, EFFECT_COLORS[flag]) for flag in PRIORITY
+                if EFFECT_ACTIVE[flag](self)]
 
     def _draw_fuel_ring(self, surface):
         """Arc ring encodes fuel amount & thickness shows power level."""
         pct = self.fuel / self.max_fuel
         if pct <= 0 and not self.emitting_cooldown:
             return
-        center = (int(self.pos[0]), int(self.pos[1]))
+        cx, cy = int(self.pos[0]), int(self.pos[1])
         # thickness: 2‑4 px, wider if tail boost (emitter power proxy)
         thick = 3 if self.tail_multiplier == 1 else 5
         radius = self.radius + 6
-        start_angle = -math.pi / 2
-        end_angle   = start_angle + 2*math.pi * pct
+        # Arcs are quantised to FUEL_RING_STEPS and blitted from a cache
+        level = min(max(round(pct * FUEL_RING_STEPS), 0), FUEL_RING_STEPS)
+        pct = level / FUEL_RING_STEPS
         # color gradient green→yellow→red
         if pct > 0.5:
             color = (lerp(255,255,(pct-0.5)*2), lerp(0,255,(pct-0.5)*2), 0)
         else:
             color = (255, int(255*pct*2), 0)
-        pygame.draw.arc(surface, color,
-                        (center[0]-radius, center[1]-radius, radius*2, radius*2),
-                        start_angle, end_angle, thick)
+        surface.blit(_ring_sprite(radius, level, thick, color),
+                     (cx-radius, cy-radius))
 
         # Cooldown overlay clock‑face
         if self.emitting_cooldown:
-            t = self.cooldown_timer / COOLDOWN_DURATION  # 1→0
-            pygame.draw.arc(surface, (120,120,120),
-                            (center[0]-radius-2, center[1]-radius-2, (radius+2)*2, (radius+2)*2),
-                            start_angle, start_angle + 2*math.pi*t, thick)
+            t = self.cooldown_timer / settings.COOLDOWN_DURATION  # 1→0
+            level = min(max(round(t * FUEL_RING_STEPS), 0), FUEL_RING_STEPS)
+            surface.blit(_ring_sprite(radius+2, level, thick, (120,120,120)),
+                         (cx-radius-2, cy-radius-2))
 
     # ──────────────────────────────────────────────────────
     # Draw
@@ -166,49 +244,33 @@ class Player:
         dominant_color = effects[0][1] if effects else self.base_color
 
         # Shape selection based on dominant effect
-        sides_map = {
-            "immune": 0,   # circle
-            "shield_active": 3,
-            "special_ready": 8,
-            "tail_boost": 5,
-            "magnet_active": 6,
-            "slow_motion": 4,
-            "score_multiplier": 10,
-        }
-        shape_key = effects[0][0] if effects else None
-        num_sides = sides_map.get(shape_key, 8)
-
-        # glow (dominant)
-        draw_glow(surf, center, self.radius+4, dominant_color, alpha=70)
-
-        # base polygon / circle
-        if num_sides == 0:
-            pygame.draw.circle(surf, dominant_color, center, self.radius)
-        else:
-            pts = regular_polygon(center, self.radius, num_sides)
-            pygame.draw.polygon(surf, dominant_color, pts)
+        num_sides = EFFECT_SIDES[effects[0][0]] if effects else 8
 
         # outline rim (for shield or immune)
+        rim_color = None
         if self.immune or self.shield_active:
             rim_color = EFFECT_COLORS["immune"] if self.immune else EFFECT_COLORS["shield_active"]
-            pygame.draw.circle(surf, rim_color, center, self.radius+2, 2)
 
-        # magnet horns
+        # glow, base polygon / circle and rim: one pre-rendered sprite
+        body = _body_sprite(self.radius, num_sides, dominant_color, rim_color)
+        half = body.get_width() // 2
+        surf.blit(body, (center[0]-half, center[1]-half))
+
+        # magnet horns: spin at 0.005 rad/ms, looked up in MAGNET_STEPS steps
         if self.magnet_active:
-            angle = pygame.time.get_ticks() * 0.005
+            turn = pygame.time.get_ticks() * 0.005 / (2*math.pi)
+            dx, dy = _magnet_offsets(self.radius+5)[int(turn * MAGNET_STEPS) % MAGNET_STEPS]
             for sign in (-1,1):
-                dx = math.cos(angle) * (self.radius+5) * sign
-                dy = math.sin(angle) * (self.radius+5)
                 pygame.draw.line(surf, EFFECT_COLORS["magnet_active"],
-                                 center, (center[0]+dx, center[1]+dy), 2)
+                                 center, (center[0]+dx*sign, center[1]+dy), 2)
 
         # tail
-        if len(self.trail) > 1:
+        if self._trail_len > 1:
             pygame.draw.lines(
                 surf,
                 (255, 150, 0),
                 False,
-                [(int(x), int(y)) for x, y in self.trail],
+                self.trail.tolist(),
                 2
             )
 
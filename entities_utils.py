@@ -2,38 +2,64 @@
 
 import math
 import random
-import numpy as np
+from functools import lru_cache
+
+# Unit-circle vertices for n evenly spaced angles 2*pi*i/n, keyed by n.
+# Shapes are drawn every frame with a handful of sizes, so rotating a
+# cached table costs two trig calls per polygon instead of two per vertex.
+_UNIT_POLY = {}
+
+def _unit_polygon(n):
+    table = _UNIT_POLY.get(n)
+    if table is None:
+        table = _UNIT_POLY[n] = [
+            (math.cos(2 * math.pi * i / n), math.sin(2 * math.pi * i / n))
+            for i in range(n)
+        ]
+    return table
+
+def _rotation(rotation):
+    if rotation:
+        return math.cos(rotation), math.sin(rotation)
+    return 1.0, 0.0
+
+@lru_cache(maxsize=128)
+def _polygon_offsets(num_sides, radius, rotation):
+    """Vertex offsets of a regular polygon, for the few shapes drawn."""
+    rc, rs = _rotation(rotation)
+    rc *= radius
+    rs *= radius
+    return tuple((c * rc - s * rs, s * rc + c * rs)
+                 for c, s in _unit_polygon(num_sides))
 
 def regular_polygon(center, radius, num_sides, rotation=0):
     cx, cy = center
-    pts = []
-    for i in range(num_sides):
-        angle = 2 * math.pi * i / num_sides + rotation
-        pts.append((cx + radius * math.cos(angle),
-                    cy + radius * math.sin(angle)))
-    return pts
+    return [(cx + ox, cy + oy)
+            for ox, oy in _polygon_offsets(num_sides, radius, rotation)]
 
 def star_polygon(center, outer_radius, inner_radius, spikes, rotation=0):
     cx, cy = center
+    rc, rs = _rotation(rotation)
     pts = []
-    for i in range(2 * spikes):
-        angle = math.pi * i / spikes + rotation
+    for i, (c, s) in enumerate(_unit_polygon(2 * spikes)):
         r = outer_radius if (i % 2 == 0) else inner_radius
-        pts.append((cx + r * math.cos(angle),
-                    cy + r * math.sin(angle)))
+        x, y = c * rc - s * rs, s * rc + c * rs
+        pts.append((cx + r * x, cy + r * y))
     return pts
 
 def irregular_polygon(center, radius, num_sides, variation=0.3, rotation=0):
     cx, cy = center
+    rc, rs = _rotation(rotation)
     pts = []
-    for i in range(num_sides):
-        angle = 2 * math.pi * i / num_sides + rotation
+    for c, s in _unit_polygon(num_sides):
         r = radius * (1 + random.uniform(-variation, variation))
-        pts.append((cx + r * math.cos(angle),
-                    cy + r * math.sin(angle)))
+        x, y = c * rc - s * rs, s * rc + c * rs
+        pts.append((cx + r * x, cy + r * y))
     return pts
 
 def check_collision(a, b):
     """Return True if objects a and b overlap based on their pos and radius."""
-    distance = np.linalg.norm(a.pos - b.pos)
-    return distance < (a.radius + b.radius)
+    dx = a.pos[0] - b.pos[0]
+    dy = a.pos[1] - b.pos[1]
+    r = a.radius + b.radius
+    return dx * dx + dy * dy < r * r
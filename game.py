@@ -17,20 +17,19 @@ import math
 
 from config import (
     WIDTH, HEIGHT,
-    settings_data, FUEL_CONSUMPTION_RATE,
-    FUEL_RECHARGE_RATE, COOLDOWN_DURATION
+    settings
 )
 from entities import (
     Player, Obstacle, PowerUp, ImmunityPickup,
     ScoreBoostPickup, BoostPickup, SpecialPickup,
     ShieldPickup, SlowMotionPickup, ScoreMultiplierPickup,
     MagnetPickup, check_collision, ChaserObstacle,
-    SplitterObstacle, Emitter
+    SplitterObstacle, ObstacleField, Emitter, pulse_pickups
 )
 from entities_utils import regular_polygon, irregular_polygon
 from background import Background
 from managers import LevelManager, ExplosionManager, Camera, Timer
-from ui import Button, Leaderboard
+from ui import Button, Leaderboard, get_font, render_text
 
 
 def clamp(v, lo, hi):
@@ -65,6 +64,8 @@ class Game:
         pygame.init()
         info = pygame.display.Info()
         self.window = pygame.display.set_mode((info.current_w, info.current_h))
+        # Off-screen play area, reused every frame in the display's format
+        self.play_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
         self.clock = pygame.time.Clock()
 
         # core state
@@ -73,7 +74,8 @@ class Game:
         self.level_manager = LevelManager()
 
         # world objects / managers
-        self.obstacles = [self.spawn_obstacle() for _ in range(5)]
+        self.obstacles = ObstacleField()
+        self.obstacles.extend(self.spawn_obstacle() for _ in range(5))
         self.emitter = Emitter(self.player.pos)
         self.power_timer = Timer(7)
         self.background = Background()
@@ -126,7 +128,8 @@ class Game:
     def reset(self):
         self.player = Player()
         self.level_manager = LevelManager()
-        self.obstacles = [self.spawn_obstacle() for _ in range(5)]
+        self.obstacles = ObstacleField()
+        self.obstacles.extend(self.spawn_obstacle() for _ in range(5))
         self.emitter = Emitter(self.player.pos)
         self.powerups = []
         self.power_timer.reset()
@@ -157,9 +160,9 @@ class Game:
                     minus = pygame.Rect(WIDTH/2+50, y, 30, 30)
                     plus  = pygame.Rect(WIDTH/2+90, y, 30, 30)
                     if minus.collidepoint(pos):
-                        settings_data[key] = clamp(settings_data[key] - self.settings_steps[key], 0, 1e9)
+                        setattr(settings, key, clamp(getattr(settings, key) - self.settings_steps[key], 0, 1e9))
                     elif plus.collidepoint(pos):
-                        settings_data[key] += self.settings_steps[key]
+                        setattr(settings, key, getattr(settings, key) + self.settings_steps[key])
                 if self.settings_back_button.is_hovered(pos):
                     self.state = "menu"
 
@@ -214,34 +217,34 @@ class Game:
 
     # ──────────────────────────────────────────────────────
     # Update loop
-    def update(self, dt):
+    def update(self, dt, mouse_pos):
+        """Advance one frame; mouse_pos is the cursor in play-surface coordinates."""
+        now = time.time()
         if self.state != "playing":
-            self.flash_messages = [f for f in self.flash_messages if time.time() < f["timer"]]
+            self.flash_messages = [f for f in self.flash_messages if now < f["timer"]]
             return
 
-        now = time.time()
         self._expire_effects(now)
+        pulse_pickups(pygame.time.get_ticks())
 
         # Player movement
-        mx, my = pygame.mouse.get_pos()
-        w, h = self.window.get_size()
-        x_off, y_off = (w - WIDTH) // 2, (h - HEIGHT) // 2
-        mx, my = clamp(mx - x_off, 0, WIDTH), clamp(my - y_off, 0, HEIGHT)
+        mx, my = clamp(mouse_pos[0], 0, WIDTH), clamp(mouse_pos[1], 0, HEIGHT)
         world_mouse = np.array([mx, my], dtype=float)
         self.player.update(dt, world_mouse)
 
-        # Fuel / emitter
+        # Fuel / emitter (live values from the settings screen)
+        s = settings
         left_down = pygame.mouse.get_pressed()[0]
         emitting = False
         if left_down and not self.player.emitting_cooldown and self.player.fuel > 0:
-            self.player.fuel -= FUEL_CONSUMPTION_RATE * dt
+            self.player.fuel -= s.FUEL_CONSUMPTION_RATE * dt
             if self.player.fuel <= 0:
                 self.player.fuel = 0
                 self.player.emitting_cooldown = True
-                self.player.cooldown_timer = COOLDOWN_DURATION
+                self.player.cooldown_timer = s.COOLDOWN_DURATION
             emitting = True
 
-        self.player.fuel = min(self.player.max_fuel, self.player.fuel + FUEL_RECHARGE_RATE * dt)
+        self.player.fuel = min(self.player.max_fuel, self.player.fuel + s.FUEL_RECHARGE_RATE * dt)
         if self.player.emitting_cooldown:
             self.player.cooldown_timer -= dt
             if self.player.cooldown_timer <= 0:
@@ -251,48 +254,56 @@ class Game:
         self.emitter.update(dt, emitting)
 
         # Obstacle movement
-        for o in self.obstacles:
-            o.update(dt * self.slow_multiplier, self.player.pos)
+        self.obstacles.step(dt * self.slow_multiplier, self.player.pos)
 
         # Player vs obstacle
-        for o in self.obstacles[:]:
-            if check_collision(self.player, o):
-                if self.player.immune:
-                    continue
-                if self.player.shield_active:
-                    self.player.shield_active = False
-                    self.explosion_manager.add(o.pos.copy())
-                    if hasattr(o, "split"): self.obstacles.extend(o.split())
-                    self.obstacles.remove(o)
+        for o in self.obstacles.colliding(self.player.pos, self.player.radius):
+            if self.player.immune:
+                continue
+            if self.player.shield_active:
+                self.player.shield_active = False
+                self.explosion_manager.add(o.pos.copy())
+                if hasattr(o, "split"): self.obstacles.extend(o.split())
+                self.obstacles.remove(o)
+                continue
+            self.explosion_manager.add(self.player.pos.copy())
+            self.camera.shake(0.5, 15)
+            self.state = "gameover"
+            return
+
+        # Particles vs obstacle: one overlap mask for every pair, then each
+        # hit obstacle consumes the first particle not already spent
+        em = self.emitter
+        hits = self.obstacles.touching(em.positions[:em.n], em.radii[:em.n])
+        if hits.any():
+            items = self.obstacles[:]
+            spent = np.zeros(em.n, dtype=bool)
+            for i in np.flatnonzero(hits.any(axis=1)).tolist():
+                free = np.flatnonzero(hits[i] & ~spent)
+                if not len(free):
                     continue
-                self.explosion_manager.add(self.player.pos.copy())
-                self.camera.shake(0.5, 15)
-                self.state = "gameover"
-                return
-
-        # Particles vs obstacle
-        for o in self.obstacles[:]:
-            for p in self.emitter.particles[:]:
-                if check_collision(p, o):
-                    self.score += o.score_value
-                    self.flash_messages.append({"text": str(o.score_value), "timer": now + 1.5,
-                                                "pos": (int(o.pos[0]), int(o.pos[1])), "font_size": 25})
-                    if o.explode: self.explosion_manager.add(o.pos.copy())
-                    if hasattr(o, "split"): self.obstacles.extend(o.split())
-                    self.obstacles.remove(o)
-                    if p in self.emitter.particles:
-                        self.emitter.particles.remove(p)
-                    break
-
-        # Trail vs obstacle
-        for o in self.obstacles[:]:
-            for pt in self.player.trail[::5]:
-                if np.linalg.norm(np.array(pt) - o.pos) < o.radius:
-                    self.score += 25
-                    if o.explode: self.explosion_manager.add(o.pos.copy())
-                    if hasattr(o, "split"): self.obstacles.extend(o.split())
-                    self.obstacles.remove(o)
-                    break
+                spent[free[0]] = True
+                o = items[i]
+                self.score += o.score_value
+                self.flash_messages.append({"text": str(o.score_value), "timer": now + 1.5,
+                                            "pos": (int(o.pos[0]), int(o.pos[1])), "font_size": 25})
+                if o.explode: self.explosion_manager.add(o.pos.copy())
+                if hasattr(o, "split"): self.obstacles.extend(o.split())
+                self.obstacles.remove(o)
+            # highest index first, so swap-last kills never move a spent one
+            for i in np.flatnonzero(spent)[::-1].tolist():
+                em.kill(i)
+
+        # Trail vs obstacle (every 5th trail point)
+        hits = self.obstacles.touching(self.player.trail[::5]).any(axis=1)
+        if hits.any():
+            items = self.obstacles[:]
+            for i in np.flatnonzero(hits).tolist():
+                o = items[i]
+                self.score += 25
+                if o.explode: self.explosion_manager.add(o.pos.copy())
+                if hasattr(o, "split"): self.obstacles.extend(o.split())
+                self.obstacles.remove(o)
 
         # Spawn new pickups
         if self.power_timer.expired():
@@ -361,14 +372,13 @@ class Game:
     # ──────────────────────────────────────────────────────
     # Draw loop
     def draw(self, surf):
+        now = time.time()
         self.background.draw(surf)
-        font20 = pygame.font.SysFont("Arial", 20)
-        font30 = pygame.font.SysFont("Arial", 30)
 
         # MENU STATE
         if self.state == "menu":
             surf.fill((0, 0, 0))
-            title = pygame.font.SysFont("Arial", 60).render("Dotventure", True, (255, 255, 255))
+            title = render_text("Dotventure", 60)
             surf.blit(title, (WIDTH//2 - title.get_width()//2, 50))
             for b in self.menu_buttons:
                 b.draw(surf)
@@ -376,25 +386,25 @@ class Game:
 
         # SETTINGS STATE
         if self.state == "settings":
-            txt = font30.render("Settings", True, (255, 255, 255))
+            txt = render_text("Settings", 30)
             surf.blit(txt, (WIDTH//2 - txt.get_width()//2, 30))
             for i, key in enumerate(self.settings_keys):
                 y = 100 + i * 60
-                val = font30.render(f"{key}: {settings_data[key]}", True, (255, 255, 255))
+                val = render_text(f"{key}: {getattr(settings, key)}", 30)
                 surf.blit(val, (WIDTH//2 - 150, y))
                 minus = pygame.Rect(WIDTH//2+50, y, 30, 30)
                 plus  = pygame.Rect(WIDTH//2+90, y, 30, 30)
                 pygame.draw.rect(surf, (100, 100, 100), minus)
                 pygame.draw.rect(surf, (100, 100, 100), plus)
-                surf.blit(font30.render("-", True, (255, 255, 255)), (minus.x+10, minus.y+3))
-                surf.blit(font30.render("+", True, (255, 255, 255)), (plus.x+10, plus.y+3))
+                surf.blit(render_text("-", 30), (minus.x+10, minus.y+3))
+                surf.blit(render_text("+", 30), (plus.x+10, plus.y+3))
             self.settings_back_button.draw(surf)
             return
 
         # SCOREBOARD STATE
         if self.state == "scoreboard":
             surf.fill((0, 0, 0))
-            title = font30.render("Score Board", True, (255, 255, 255))
+            title = render_text("Score Board", 30)
             surf.blit(title, (WIDTH//2 - title.get_width()//2, 50))
             self.leaderboard.draw(surf)
             self.back_button.draw(surf)
@@ -403,11 +413,7 @@ class Game:
         # ABOUT STATE (multi‑column panel)
         if self.state == "about":
             surf.fill(tuple(self.about_data.get("panel_background_color", [0, 0, 0])))
-            title_font = pygame.font.SysFont("Arial", 50)
-            desc_font  = pygame.font.SysFont("Arial", 20)
-            instr_font = pygame.font.SysFont("Arial", 20)
-
-            title_surf = title_font.render(self.about_data.get("title", "About"), True, (255,255,255))
+            title_surf = render_text(self.about_data.get("title", "About"), 50)
             surf.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2, 30))
             self.back_button.draw(surf)
 
@@ -457,12 +463,12 @@ class Game:
                         pygame.draw.polygon(surf, color, irregular_polygon((cx+r, cy+r), r, sides, var))
 
                     label = f"{obj.get('name','')}: {obj.get('description','')}"
-                    surf.blit(desc_font.render(label, True, (255,255,255)), (cx + r*2 + 10, cy))
+                    surf.blit(render_text(label, 20), (cx + r*2 + 10, cy))
 
             # Instructions
             y_offset = 100 + max(len(cols[0]), len(cols[1]))*spacing + 20
             for line in self.about_data.get("instructions", []):
-                instr = instr_font.render(line, True, (200,200,200))
+                instr = render_text(line, 20, (200,200,200))
                 surf.blit(instr, (WIDTH//2 - instr.get_width()//2, y_offset))
                 y_offset += 24
             return
@@ -471,24 +477,23 @@ class Game:
         self.player.draw(surf)
         for o in self.obstacles:
             o.draw(surf)
-        for pu in self.powerups:
-            pu.draw(surf)
+        surf.blits([pu.blit_args() for pu in self.powerups], doreturn=False)
         self.emitter.draw(surf)
         self.explosion_manager.draw(surf)
 
         # Special marker
         if self.player.special_pickup:
-            surf.blit(font20.render("Special", True, (128, 0, 128)), (10, 80))
+            surf.blit(render_text("Special", 20, (128, 0, 128)), (10, 80))
         if self.player.special_active:
             pygame.draw.circle(surf, (255, 0, 255),
                                (int(self.player.pos[0]), int(self.player.pos[1])),
                                self.player.radius + 4, 2)
 
-        # Score / Level / Fuel text line
+        # Score / Level / Fuel text line (the score changes too often to cache)
         bar_h = 30
-        score_txt = font20.render(f"Score: {int(self.score)}", True, (255, 255, 255))
-        level_txt = font20.render(f"Level: {self.level_manager.get_level()}", True, (255, 255, 255))
-        fuel_txt  = font20.render(f"Fuel: {int(self.player.fuel)}", True, (255, 255, 255))
+        score_txt = get_font(20).render(f"Score: {int(self.score)}", True, (255, 255, 255))
+        level_txt = render_text(f"Level: {self.level_manager.get_level()}", 20)
+        fuel_txt  = render_text(f"Fuel: {int(self.player.fuel)}", 20)
         total_w = score_txt.get_width() + level_txt.get_width() + fuel_txt.get_width() + 40
         x = (WIDTH - total_w) // 2
         for txt in (score_txt, level_txt, fuel_txt):
@@ -496,7 +501,6 @@ class Game:
             x += txt.get_width() + 20
 
         # Active pickup icons + timers
-        now = time.time()
         mapping = {
             "immunity":          ("immune",             "immune_timer"),
             "tail_boost":        ("tail_boost",         "tail_boost_timer"),
@@ -512,22 +516,22 @@ class Game:
         icon_x, icon_y = 10, bar_h + 10
         for eff, rem in active:
             draw_powerup_icon(surf, (icon_x + 10, icon_y + 10), eff)
-            surf.blit(font20.render(f"{rem}", True, (255, 255, 255)), (icon_x + 30, icon_y))
+            surf.blit(render_text(f"{rem}", 20), (icon_x + 30, icon_y))
             icon_y += 35
 
         # GameOver overlay
         if self.state == "gameover":
             surf.fill((0, 0, 0))
-            go = pygame.font.SysFont("Arial", 50).render("Game Over", True, (255, 255, 255))
-            sc = pygame.font.SysFont("Arial", 40).render(f"Score: {int(self.score)}", True, (255, 255, 255))
+            go = render_text("Game Over", 50)
+            sc = render_text(f"Score: {int(self.score)}", 40)
             surf.blit(go, (WIDTH//2 - go.get_width()//2, HEIGHT//2 - 100))
             surf.blit(sc, (WIDTH//2 - sc.get_width()//2, HEIGHT//2))
             self.restart_button.draw(surf)
 
         # Flash messages
         for f in self.flash_messages:
-            if time.time() < f["timer"]:
-                txt = pygame.font.SysFont("Arial", f["font_size"]).render(f["text"], True, (255, 255, 0))
+            if now < f["timer"]:
+                txt = render_text(f["text"], f["font_size"], (255, 255, 0))
                 surf.blit(txt, (f["pos"][0] - txt.get_width() // 2,
                                 f["pos"][1] - txt.get_height() // 2))
 
@@ -536,11 +540,11 @@ class Game:
     def run(self):
         running = True
         while running:
-            dt = self.clock.tick(settings_data["FPS"]) / 1000.0
+            dt = self.clock.tick(settings.FPS) / 1000.0
             w, h = self.window.get_size()
             x_off, y_off = (w - WIDTH) // 2, (h - HEIGHT) // 2
-            adj_mouse = (pygame.mouse.get_pos()[0] - x_off,
-                         pygame.mouse.get_pos()[1] - y_off)
+            mx, my = pygame.mouse.get_pos()
+            adj_mouse = (mx - x_off, my - y_off)
 
             for ev in pygame.event.get():
                 if ev.type == pygame.QUIT:
@@ -549,13 +553,12 @@ class Game:
                     self.handle_event(ev, adj_mouse)
 
             if self.state == "playing":
-                self.update(dt)
+                self.update(dt, adj_mouse)
 
-            play_surface = pygame.Surface((WIDTH, HEIGHT))
-            play_surface.fill((0, 0, 0))
-            self.draw(play_surface)
+            # draw() starts with the background's full clear
+            self.draw(self.play_surface)
             self.window.fill((255, 255, 255))
-            self.window.blit(play_surface, (x_off, y_off))
+            self.window.blit(self.play_surface, (x_off, y_off))
             pygame.display.flip()
 
         pygame.quit()
@@ -1,49 +1,48 @@
 # game_loop.py
 
 import pygame
-from config import WIDTH, HEIGHT, settings_data
+from config import WIDTH, HEIGHT, settings
 from game import Game
 
 def process_events(game, x_offset, y_offset):
-    adjusted = (pygame.mouse.get_pos()[0] - x_offset,
-                pygame.mouse.get_pos()[1] - y_offset)
+    mx, my = pygame.mouse.get_pos()
+    adjusted = (mx - x_offset, my - y_offset)
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             return False, adjusted
         game.handle_event(event, adjusted)
     return True, adjusted
 
-def update_game(game, dt):
+def update_game(game, dt, mouse_pos):
     if game.state == "playing":
-        game.update(dt)
+        game.update(dt, mouse_pos)
 
 def render_game(game, screen, game_surface, x_offset, y_offset):
-    game_surface.fill((0,0,0))
+    # Game.draw always starts with Background.draw, which clears the surface
     game.draw(game_surface)
     screen.fill((255,255,255))
     screen.blit(game_surface, (x_offset, y_offset))
     pygame.display.flip()
 
 def run_game():
-    pygame.init()
-    clock = pygame.time.Clock()
-    info = pygame.display.Info()
-    screen = pygame.display.set_mode((info.current_w, info.current_h))
-    game_surface = pygame.Surface((WIDTH, HEIGHT))
+    # Game() initialises pygame and opens the window; draw into its
+    # display-format play surface rather than a second, unconverted one
     game = Game()
+    clock = game.clock
+    screen = game.window
+    game_surface = game.play_surface
     running = True
 
     while running:
         # Re-read FPS each frame
-        FPS = settings_data["FPS"]
-        dt = clock.tick(FPS) / 1000.0
+        dt = clock.tick(settings.FPS) / 1000.0
 
         w, h = screen.get_size()
         x_off = (w - WIDTH) // 2
         y_off = (h - HEIGHT) // 2
 
-        running, _ = process_events(game, x_off, y_off)
-        update_game(game, dt)
+        running, mouse_pos = process_events(game, x_off, y_off)
+        update_game(game, dt, mouse_pos)
         render_game(game, screen, game_surface, x_off, y_off)
 
     pygame.quit()
@@ -1,9 +1,9 @@
 # managers.py
 
 import random
-import math
 import pygame
 import time
+from entities_particle import ParticleSystem
 
 class Timer:
     def __init__(self, duration):
@@ -27,18 +27,15 @@ class LevelManager:
 
 class Explosion:
     def __init__(self, pos):
-        from entities import Particle
-        self.particles = [Particle(pos) for _ in range(30)]
+        self.particles = ParticleSystem(30)
+        self.particles.spawn(pos, 30)
         self.done = False
     def update(self, dt):
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.life > 0]
-        if not self.particles:
+        self.particles.update(dt)
+        if not self.particles.n:
             self.done = True
     def draw(self, surf):
-        for p in self.particles:
-            p.draw(surf)
+        self.particles.draw(surf)
 
 class ExplosionManager:
     def __init__(self):
@@ -0,0 +1,124 @@
+import sys
+import types
+import unittest
+
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.Surface = lambda *args, **kwargs: None
+pygame_stub.SRCALPHA = 0
+pygame_stub.draw = types.SimpleNamespace(
+    circle=lambda *args, **kwargs: None,
+    polygon=lambda *args, **kwargs: None,
+)
+pygame_stub.time = types.SimpleNamespace(get_ticks=lambda: 0)
+sys.modules.setdefault("pygame", pygame_stub)
+
+import numpy as np
+
+from entities_obstacles import Obstacle, ChaserObstacle, ObstacleField
+from config import WIDTH, HEIGHT
+
+
+def make_obstacle(x, y, direction, speed=100, radius=10):
+    obstacle = Obstacle(level=1)
+    obstacle.pos = (x, y)
+    obstacle.direction = direction
+    obstacle.speed = speed
+    obstacle.radius = radius
+    return obstacle
+
+
+class ObstacleFieldTests(unittest.TestCase):
+    def test_step_matches_per_obstacle_update(self):
+        specs = [(100, 100, 0.3), (WIDTH - 15, HEIGHT / 2, 0.0), (400, 12, -1.2)]
+        field = ObstacleField(capacity=2)
+        field.extend(make_obstacle(*spec) for spec in specs)
+        loose = [make_obstacle(*spec) for spec in specs]
+
+        for _ in range(5):
+            field.step(0.1)
+            for obstacle in loose:
+                obstacle.update(0.1)
+
+        for in_field, alone in zip(field, loose):
+            # Rows are float32, so allow for single-precision rounding
+            np.testing.assert_allclose(in_field.pos, alone.pos, rtol=1e-5)
+            self.assertAlmostEqual(in_field.direction, alone.direction, places=5)
+
+    def test_step_steers_chasers_like_chaser_update(self):
+        player_pos = np.array([WIDTH / 2, HEIGHT / 2])
+        field = ObstacleField()
+        loose = []
+        for _ in range(4):
+            chaser = ChaserObstacle(1, player_pos)
+            twin = ChaserObstacle(1, player_pos)
+            twin._row[:] = chaser._row
+            field.append(chaser)
+            loose.append(twin)
+        field.append(make_obstacle(100, 100, 0.3))
+
+        for _ in range(5):
+            field.step(0.1, player_pos)
+            for chaser in loose:
+                chaser.update(0.1, player_pos)
+
+        for in_field, alone in zip(field, loose):
+            np.testing.assert_allclose(in_field.pos, alone.pos, rtol=1e-4)
+            self.assertAlmostEqual(in_field.rotation, alone.rotation, places=5)
+
+    def test_remove_keeps_remaining_obstacles_bound(self):
+        field = ObstacleField()
+        a, b, c = (make_obstacle(x, 50, 0.0) for x in (10, 20, 30))
+        field.extend([a, b, c])
+
+        field.remove(a)
+        a.pos[0] = 999
+
+        self.assertEqual([o.pos[0] for o in field], [30, 20])
+        c.pos[0] = 35
+        self.assertEqual(field.rows[0, 0], 35)
+        self.assertRaises(ValueError, field.remove, a)
+
+    def test_remove_rejects_obstacle_never_added(self):
+        field = ObstacleField()
+        field.append(make_obstacle(10, 10, 0.0))
+
+        self.assertRaises(ValueError, field.remove, make_obstacle(20, 20, 0.0))
+        self.assertEqual(len(field), 1)
+
+    def test_colliding_returns_overlapping_obstacles(self):
+        field = ObstacleField()
+        near, far = make_obstacle(100, 100, 0.0), make_obstacle(500, 500, 0.0)
+        field.extend([near, far])
+
+        self.assertEqual(field.colliding((115, 100), 6), [near])
+        self.assertEqual(field.colliding((300, 300), 6), [])
+
+    def test_colliding_follows_movement_and_removal(self):
+        field = ObstacleField()
+        a, b = make_obstacle(100, 100, 0.0), make_obstacle(400, 400, 0.0)
+        field.extend([a, b])
+        self.assertEqual(field.colliding((400, 400), 1), [b])
+
+        field.step(1.0)  # both move 100px to the right
+        self.assertEqual(field.colliding((400, 400), 1), [])
+        self.assertEqual(field.colliding((500, 400), 1), [b])
+
+        field.remove(a)
+        self.assertEqual(field.colliding((500, 400), 1), [b])
+        self.assertEqual(field.colliding((200, 100), 1), [])
+
+    def test_touching_masks_overlapping_pairs(self):
+        field = ObstacleField()
+        field.extend([make_obstacle(100, 100, 0.0), make_obstacle(400, 400, 0.0)])
+        points = np.array([[115, 100], [400, 405], [250, 250]], dtype=np.float32)
+
+        np.testing.assert_array_equal(
+            field.touching(points, np.array([6, 0, 500])),
+            [[True, False, True], [False, True, True]])
+        np.testing.assert_array_equal(
+            field.touching(points).any(axis=1), [False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import types
+import unittest
+
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.Surface = lambda *args, **kwargs: None
+pygame_stub.SRCALPHA = 0
+sys.modules.setdefault("pygame", pygame_stub)
+
+import numpy as np
+
+from entities_particle import ParticleSystem
+
+
+def make_system(count):
+    """A system of stationary particles whose x coordinate is their id."""
+    system = ParticleSystem(max_particles=count)
+    system.spawn((0, 0), count)
+    system.positions[:count, 0] = np.arange(count)
+    system.velocities[:count] = 0
+    system.lives[:count] = 10 + np.arange(count)
+    return system
+
+
+def live_ids(system):
+    return system.positions[:system.n, 0].astype(int)
+
+
+class ParticleSystemTests(unittest.TestCase):
+    def test_update_keeps_exactly_the_survivors(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            system = make_system(40)
+            dying = rng.random(40) < 0.4
+            system.lives[:40][dying] = 0.05
+
+            system.update(0.1)
+
+            survivors = np.flatnonzero(~dying)
+            self.assertEqual(system.n, len(survivors))
+            np.testing.assert_array_equal(np.sort(live_ids(system)), survivors)
+            # every column moved with its particle
+            ids = live_ids(system)
+            np.testing.assert_allclose(system.lives[:system.n], 10 + ids - 0.1, rtol=1e-6)
+
+    def test_kill_highest_index_first_removes_exactly_that_subset(self):
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            system = make_system(40)
+            doomed = np.flatnonzero(rng.random(40) < 0.4)
+
+            for i in doomed[::-1].tolist():
+                system.kill(i)
+
+            survivors = np.setdiff1d(np.arange(40), doomed)
+            self.assertEqual(system.n, len(survivors))
+            np.testing.assert_array_equal(np.sort(live_ids(system)), survivors)
+            np.testing.assert_array_equal(system.lives[:system.n], 10 + live_ids(system))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import sys
+import types
+import unittest
+
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.Surface = lambda *args, **kwargs: None
+pygame_stub.SRCALPHA = 0
+pygame_stub.time = types.SimpleNamespace(get_ticks=lambda: 0)
+sys.modules.setdefault("pygame", pygame_stub)
+
+import numpy as np
+
+from entities_player import Player, TRAIL_LENGTH
+
+
+class PlayerTrailTests(unittest.TestCase):
+    def test_trail_keeps_latest_points_oldest_first(self):
+        player = Player()
+        expected = []
+        for i in range(3 * TRAIL_LENGTH):
+            player.update(1 / 60, np.array([100.0 + i * 5, 300.0]))
+            expected.append(tuple(player.pos.astype(np.int32)))
+
+        np.testing.assert_array_equal(player.trail, expected[-TRAIL_LENGTH:])
+
+    def test_trail_shrinks_when_tail_boost_ends(self):
+        player = Player()
+        player.tail_multiplier = 2
+        for i in range(3 * TRAIL_LENGTH):
+            player.update(1 / 60, np.array([100.0 + i * 5, 300.0]))
+        self.assertEqual(len(player.trail), 2 * TRAIL_LENGTH)
+
+        player.tail_multiplier = 1
+        player.update(1 / 60, player.pos.copy())
+        self.assertEqual(len(player.trail), TRAIL_LENGTH)
+        np.testing.assert_array_equal(player.trail[-1], player.pos.astype(np.int32))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,17 +2,28 @@
 
 import pygame
 import os
+from functools import lru_cache
 from config import WIDTH
 
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Arial at the given size; SysFont scans the system fonts, so once each."""
+    return pygame.font.SysFont("Arial", size)
+
+@lru_cache(maxsize=512)
+def render_text(text, size, color=(255, 255, 255)):
+    """Antialiased text, rendered once per (text, size, color)."""
+    return get_font(size).render(text, True, color)
+
 class Button:
     def __init__(self, rect, text, font_size):
         self.rect = pygame.Rect(rect)
         self.text = text
-        self.font = pygame.font.SysFont("Arial", font_size)
+        self.font_size = font_size
 
     def draw(self, surf):
         pygame.draw.rect(surf, (100, 100, 100), self.rect)
-        txt = self.font.render(self.text, True, (255, 255, 255))
+        txt = render_text(self.text, self.font_size)
         surf.blit(
             txt,
             (self.rect.centerx - txt.get_width()/2,
@@ -48,11 +59,10 @@ class Leaderboard:
                 f.write(f"{s}\n")
 
     def draw(self, surf):
-        font = pygame.font.SysFont("Arial", 30)
         y = 100
-        title = font.render("Leaderboard", True, (255,255,255))
+        title = render_text("Leaderboard", 30)
         surf.blit(title, (WIDTH//2 - title.get_width()//2, 50))
         for s in self.scores:
-            txt = font.render(f"{s:.0f}", True, (255,255,255))
+            txt = render_text(f"{s:.0f}", 30)
             surf.blit(txt, (WIDTH//2 - txt.get_width()//2, y))
             y += 40